@@ -5,19 +5,89 @@
 Він дозволяє підраховувати кількість логів за рівнями, фільтрувати 
 їх та виводити у табличному форматі.
 
+Класи:
+- LogEntry
+
 Функції:
-- parse_log_line(line: str) -> dict
-- load_logs(file_path: str) -> list[dict]
-- filter_logs_by_level(logs: list[dict], level: str) -> list[dict]
-- count_log_by_level(logs: list[dict]) -> dict
+- parse_log_line(line: str) -> LogEntry
+- parse_log_bytes(line: bytes) -> tuple[str, str, str]
+- iter_logs(file_path: str) -> Iterator[LogEntry]
+- load_logs(file_path: str, level: str | None) -> list[LogEntry]
+- load_and_count(file_path: str, filter_level: str | None) -> tuple[dict, list[LogEntry]]
+- filter_logs_by_level(logs: list[LogEntry], level: str) -> list[LogEntry]
+- count_log_by_level(logs: list[LogEntry]) -> dict
 - display_log_counts(counts: dict)
 - main()
 """
+import mmap
+import os
+import re
 import sys
-from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from dataclasses import dataclass
+from typing import Iterator
+
+# Кеш інтернованих рівнів логування: усі записи одного рівня посилаються
+# на один і той самий об'єкт рядка.
+_LEVEL_CACHE = {level: sys.intern(level) for level in ("INFO", "ERROR", "DEBUG", "WARNING")}
+
+# Файли, менші за цей розмір (у байтах), обробляються в поточному процесі:
+# запуск пулу процесів коштує більше, ніж сам підрахунок.
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+
+# Третє поле кожного рядка - рівень логування. Використовується, коли
+# потрібен лише підрахунок: findall проходить буфер у C-коді й повертає
+# лише токени рівнів, без об'єктів для цілих рядків. Поля розділяються
+# пробільними символами ASCII, крім '\n', як і в _split_fields;
+# рядки з менш ніж трьома полями не збігаються з шаблоном.
+_LEVEL_PATTERN = re.compile(rb"^[^\S\n]*\S+[^\S\n]+\S+[^\S\n]+(\S+)", re.MULTILINE)
+
+@dataclass(slots=True)
+class LogEntry:
+    """
+    Один парсений рядок лог-файлу.
+
+    Атрибути:
+    ---------
+    date_time : str
+        Поєднана дата та час.
+    level : str
+        Рівень логування.
+    text : str
+        Текст повідомлення.
+    """
+    date_time: str
+    level: str
+    text: str
+
+def _intern_level(level: str) -> str:
+    """
+    Повертає спільний інтернований об'єкт для рівня логування.
+    """
+    return _LEVEL_CACHE.get(level) or _LEVEL_CACHE.setdefault(level, sys.intern(level))
 
-def parse_log_line(line: str) -> dict:
+def _split_fields(line: bytes) -> list[bytes] | None:
+    """
+    Розбиває байтовий рядок на дату, час, рівень логування та текст
+    повідомлення за пробільними символами ASCII (пробіл, '\\t', '\\n',
+    '\\r', '\\v', '\\f'). Інші символи Unicode, зокрема нерозривний пробіл,
+    роздільниками не вважаються.
+
+    Для рядка без повідомлення текст - b"". Якщо полів менше трьох, повертає None.
+    """
+    parts = line.split(maxsplit=3)
+    if len(parts) < 3:
+        return None
+    if len(parts) == 3:
+        parts.append(line[:0])
+    else:
+        parts[3] = parts[3].rstrip()
+    return parts
+
+def parse_log_line(line: str) -> LogEntry:
     """
     Парсить рядок лог-файлу на окремі компоненти.
 
@@ -25,90 +95,301 @@ def parse_log_line(line: str) -> dict:
     ----------
     line : str
         Рядок з лог-файлу, який містить дату, час, рівень логування та текст повідомлення.
+        Поля розділені пробільними символами ASCII, як і в parse_log_bytes;
+        пробільні символи в кінці рядка відкидаються.
+        Рядок без тексту повідомлення дає запис з порожнім текстом.
 
     Повертає:
     ---------
-    dict
-        Словник, що містить:
-        - 'date_time': поєднана дата та час (str)
-        - 'level': рівень логування (str)
-        - 'text': текст повідомлення (str)
-    """
-    date, time, level, *text = line.split()
-    date_time = date + " " + time
-    text = " ".join(text)
-    parsed_line = {
-        "date_time": date_time,
-        "level": level,
-        "text": text
-    }
-    return parsed_line
-
-def load_logs(file_path: str) -> list[dict]:
+    LogEntry
+        Запис, що містить дату та час, рівень логування і текст повідомлення.
+    """
+    parts = _split_fields(line.encode())
+    if parts is None:
+        raise ValueError(f"Malformed log line: {line!r}")
+    date_time, level, text = _decode_fields(parts)
+    return LogEntry(date_time, _intern_level(level), text)
+
+def parse_log_bytes(line: bytes) -> tuple[str, str, str]:
+    """
+    Парсить сирий (байтовий) рядок лог-файлу без попереднього декодування.
+
+    Поля розділяються пробільними символами ASCII, а декодуються лише готові
+    поля, тому функція підходить для рядків, прочитаних з mmap або бінарного
+    файлу. parse_log_line використовує те саме правило.
+
+    Параметри:
+    ----------
+    line : bytes
+        Рядок з лог-файлу; пробільні символи ASCII в кінці рядка відкидаються.
+
+    Повертає:
+    ---------
+    tuple[str, str, str]
+        Кортеж (дата та час, рівень логування, текст повідомлення).
+    """
+    parts = _split_fields(line)
+    if parts is None:
+        raise ValueError(f"Malformed log line: {line!r}")
+    return _decode_fields(parts)
+
+def _decode_fields(parts: list[bytes]) -> tuple[str, str, str]:
+    """
+    Декодує поля, виділені _split_fields з байтового рядка.
+    """
+    date, time, level, text = parts
+    return (date + b" " + time).decode(), level.decode(), text.decode()
+
+@contextmanager
+def _map_file(file_path: str) -> Iterator[bytes]:
+    """
+    Відображає лог-файл у пам'ять лише для читання.
+
+    Сторінки файлу підвантажуються ядром на вимогу, без копіювання
+    всього вмісту в пам'ять процесу. Для пустого файлу повертає b"",
+    оскільки mmap не підтримує відображення нульової довжини.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+def _iter_lines(buffer: bytes, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """
+    Повертає рядки буфера в діапазоні [start, end) без символу '\\n'.
+    """
+    if end is None:
+        end = len(buffer)
+    while start < end:
+        newline = buffer.find(b"\n", start, end)
+        if newline == -1:
+            newline = end
+        yield buffer[start:newline]
+        start = newline + 1
+
+def _iter_entries(buffer: bytes) -> Iterator[LogEntry]:
+    """
+    Повертає записи для всіх рядків буфера, пропускаючи порожні рядки
+    та рядки з менш ніж трьома полями.
+    """
+    for raw_line in _iter_lines(buffer):
+        parts = _split_fields(raw_line)
+        if parts is None:
+            continue
+        date_time, level, text = _decode_fields(parts)
+        yield LogEntry(date_time, _intern_level(level), text)
+
+def iter_logs(file_path: str) -> Iterator[LogEntry]:
+    """
+    Послідовно зчитує лог-файл і повертає парсені рядки по одному.
+
+    На відміну від load_logs, не накопичує весь файл у пам'яті,
+    тому підходить для великих лог-файлів. Рядки читаються й парсяться так само,
+    як у load_logs: порожні рядки та рядки з менш ніж трьома полями пропускаються.
+
+    Параметри:
+    ----------
+    file_path : str
+        Шлях до лог-файлу, який потрібно зчитати.
+
+    Повертає:
+    ---------
+    Iterator[LogEntry]
+        Ітератор записів, де кожен запис представляє парсений рядок лог-файлу.
+    """
+    with _map_file(file_path) as buffer:
+        yield from _iter_entries(buffer)
+
+def load_logs(file_path: str, level: str | None = None) -> list[LogEntry]:
     """
     Зчитує лог-файл та парсить його рядки.
 
+    Якщо вказано рівень логування, рядки, що не містять його як підрядок,
+    відкидаються ще до парсингу, а решта перевіряється точним порівнянням рівня.
+    Порожні рядки та рядки з менш ніж трьома полями пропускаються.
+
     Параметри:
     ----------
     file_path : str
         Шлях до лог-файлу, який потрібно зчитати.
+    level : str | None
+        Рівень логування, за яким потрібно відібрати рядки. Якщо не вказано,
+        повертаються всі рядки.
 
     Повертає:
     ---------
-    list[dict]
-        Список словників, де кожен словник представляє парсений рядок лог-файлу.
+    list[LogEntry]
+        Список записів, де кожен запис представляє парсений рядок лог-файлу.
         Якщо файл не знайдено або сталася помилка, повертає пустий список.
     """
     try:
-        path = Path(file_path)
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"The file {file_path} does not exist or is not a file.")
-
-        parsed_lines = []
-
-        with open(file_path) as file:
-            lines = file.readlines()
+        with _map_file(file_path) as buffer:
+            if level:
+                return _find_level_lines(buffer, 0, len(buffer), level.upper().encode())
 
-        parsed_lines.extend(parse_log_line(line.strip()) for line in lines)
-        return parsed_lines
+            return list(_iter_entries(buffer))
 
-    except FileNotFoundError as e:
+    except (FileNotFoundError, IsADirectoryError) as e:
         print(e)
         return []
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
         return []
 
-def filter_logs_by_level(logs:list[dict], level: str) -> list[dict]:
+def _chunk_bounds(buffer: bytes, parts: int) -> list[int]:
+    """
+    Ділить буфер на parts приблизно рівних частин, межі яких припадають
+    на початок рядка.
+    """
+    size = len(buffer)
+    step = size // parts
+    bounds = [0]
+    for i in range(1, parts):
+        newline = buffer.find(b"\n", max(i * step, bounds[-1]))
+        bounds.append(size if newline == -1 else newline + 1)
+    bounds.append(size)
+    return bounds
+
+def _find_level_lines(buffer: bytes, start: int, end: int, wanted: bytes) -> list[LogEntry]:
+    """
+    Відбирає в діапазоні [start, end) буфера записи з рівнем wanted.
+
+    Буфер переглядається пошуком підрядка wanted, тож парсяться лише рядки,
+    що його містять; рівень кожного з них перевіряється точним порівнянням.
+    """
+    filtered_logs = []
+    position = buffer.find(wanted, start, end)
+    while position != -1:
+        line_start = max(buffer.rfind(b"\n", start, position) + 1, start)
+        line_end = buffer.find(b"\n", position, end)
+        if line_end == -1:
+            line_end = end
+        parts = _split_fields(buffer[line_start:line_end])
+        if parts is not None and parts[2] == wanted:
+            date_time, level, text = _decode_fields(parts)
+            filtered_logs.append(LogEntry(date_time, _intern_level(level), text))
+        position = buffer.find(wanted, line_end + 1, end)
+    return filtered_logs
+
+def _scan_lines(buffer: bytes, start: int, end: int,
+                wanted: bytes | None) -> tuple[Counter, list[LogEntry]]:
+    """
+    Підраховує рівні логування в діапазоні [start, end) буфера та відбирає
+    рядки з рівнем wanted. Якщо wanted не вказано, лише підраховує рівні.
+    Порожні рядки та рядки з менш ніж трьома полями пропускаються.
+    """
+    counted_levels = Counter(_LEVEL_PATTERN.findall(buffer, start, end))
+    if wanted is None:
+        return counted_levels, []
+    return counted_levels, _find_level_lines(buffer, start, end, wanted)
+
+def _available_cpus() -> int:
+    """
+    Повертає кількість процесорів, доступних поточному процесу.
+
+    На відміну від os.cpu_count, враховує прив'язку процесу до процесорів
+    (наприклад, у контейнері), якщо платформа її підтримує.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _scan_chunk(file_path: str, start: int, end: int,
+                wanted: bytes | None) -> tuple[Counter, list[LogEntry]]:
+    """
+    Обробляє частину лог-файлу в окремому процесі.
+    """
+    with _map_file(file_path) as buffer:
+        return _scan_lines(buffer, start, end, wanted)
+
+def load_and_count(file_path: str, filter_level: str | None = None) -> tuple[dict, list[LogEntry]]:
+    """
+    За один прохід по лог-файлу підраховує логи за рівнями та відбирає
+    записи заданого рівня.
+
+    Для підрахунку достатньо рівня логування, тому в записи LogEntry
+    перетворюються лише відібрані рядки. Файли, більші за
+    PARALLEL_THRESHOLD, діляться на частини за межами рядків і обробляються
+    паралельно в пулі процесів.
+
+    Параметри:
+    ----------
+    file_path : str
+        Шлях до лог-файлу, який потрібно зчитати.
+    filter_level : str | None
+        Рівень логування, рядки якого потрібно відібрати. Якщо не вказано,
+        виконується лише підрахунок.
+
+    Повертає:
+    ---------
+    tuple[dict, list[LogEntry]]
+        Словник з кількістю логів за рівнями та список записів заданого рівня.
+        Якщо файл не знайдено або сталася помилка, повертає пусті словник і список.
+    """
+    try:
+        wanted = filter_level.upper().encode() if filter_level else None
+
+        with _map_file(file_path) as buffer:
+            size = len(buffer)
+            workers = _available_cpus() if size >= PARALLEL_THRESHOLD else 1
+            if workers == 1:
+                results = [_scan_lines(buffer, 0, size, wanted)]
+            else:
+                bounds = _chunk_bounds(buffer, workers)
+                with ProcessPoolExecutor(workers) as executor:
+                    results = list(executor.map(_scan_chunk, repeat(file_path),
+                                                bounds[:-1], bounds[1:], repeat(wanted)))
+
+        counted_levels = Counter()
+        filtered_logs = []
+        for chunk_counts, chunk_logs in results:
+            counted_levels.update(chunk_counts)
+            # Записи з інших процесів приходять з власними копіями рядків рівнів.
+            for log in chunk_logs:
+                log.level = _intern_level(log.level)
+            filtered_logs.extend(chunk_logs)
+
+        return {level.decode(): count for level, count in counted_levels.items()}, filtered_logs
+
+    except (FileNotFoundError, IsADirectoryError) as e:
+        print(e)
+        return {}, []
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        return {}, []
+
+def filter_logs_by_level(logs: list[LogEntry], level: str) -> list[LogEntry]:
     """
     Фільтрує лог-файли за заданим рівнем.
 
     Параметри:
     ----------
-    logs : list[dict]
+    logs : list[LogEntry]
         Список парсених логів, які потрібно фільтрувати.
     level : str
         Рівень логування, за яким потрібно фільтрувати (INFO, ERROR, DEBUG, WARNING).
 
     Повертає:
     ---------
-    list[dict]
-        Список словників, що містять лише лог-файли з заданим рівнем.
+    list[LogEntry]
+        Список записів, що містять лише лог-файли з заданим рівнем.
     """
-    filtered_list = []
-    for log in logs:
-        if level.upper() == log["level"]:
-            filtered_list.append(log)
-    return filtered_list
+    wanted = level.upper()
+    return [log for log in logs if log.level == wanted]
 
 
-def count_log_by_level(logs: list[dict]) -> dict:
+def count_log_by_level(logs: list[LogEntry]) -> dict:
     """
     Підраховує кількість логів за рівнями.
 
     Параметри:
     ----------
-    logs : list[dict]
+    logs : list[LogEntry]
         Список парсених логів, для яких потрібно виконати підрахунок.
 
     Повертає:
@@ -116,13 +397,7 @@ def count_log_by_level(logs: list[dict]) -> dict:
     dict
         Словник, де ключами є рівні логування, а значеннями - кількість появ кожного рівня.
     """
-    counted_levels = Counter()
-
-    for log in logs:
-        level = log.get("level")
-        counted_levels[level] += 1
-
-    return dict(counted_levels)
+    return dict(Counter(log.level for log in logs))
 
 def display_log_counts(counts: dict):
     """
@@ -133,10 +408,9 @@ def display_log_counts(counts: dict):
     counts : dict
         Словник, де ключами є рівні логування, а значеннями - кількість появ кожного рівня.
     """
-    print("Рівень логування | Кількість")
-    print("-----------------|----------")
-    for k, v in counts.items():
-        print(f"{k:<16} | {v}")
+    lines = ["Рівень логування | Кількість", "-----------------|----------"]
+    lines.extend(f"{k:<16} | {v}" for k, v in counts.items())
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """
@@ -158,18 +432,17 @@ def main():
     if len(sys.argv) == 3:
         level = sys.argv[2]
 
-    logs = load_logs(file_path)
-    if not logs:
+    counts, filtered_logs = load_and_count(file_path, level)
+    if not counts:
         print("No logs to display.")
         return
 
-    display_log_counts(count_log_by_level(logs))
+    display_log_counts(counts)
 
     if level != "":
-        filtered_logs = filter_logs_by_level(logs, level)
-        print(f"\nДеталі логів для рівня '{level}'")
-        for log in filtered_logs:
-            print(f"{log['date_time']} - {log['text']}")
+        sys.stdout.write(f"\nДеталі логів для рівня '{level}'\n")
+        sys.stdout.writelines(f"{log.date_time} - {log.text}\n"
+                              for log in filtered_logs)
 
 if __name__ == "__main__":
     main()
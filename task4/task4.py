@@ -20,20 +20,21 @@
     `show_all(contacts)` — повертає всі збережені контакти.
     `main()` — головна функція для запуску програми.
 """
+# Маркер відсутнього ключа для dict.get: на відміну від None,
+# не може збігтися зі збереженим значенням.
+_MISSING = object()
+
 def input_error(func):
     """
-    Декоратор, що перевіряє чи не виникає винятків при виклику функції, а саме: 
-    ValueError, KeyError та IndexError
+    Декоратор, що перехоплює непередбачені винятки при виклику функції.
+
+    Некоректні аргументи перевіряються в самих обробниках, які одразу
+    повертають повідомлення про помилку, тож декоратор лише страхує
+    від неочікуваних збоїв.
     """
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ValueError:
-            return "Give me name and phone please."
-        except KeyError:
-            return "Contact not found, please enter a valid name."
-        except IndexError:
-            return "Too few or too many arguments in your command."
         except Exception as e:
             return f"An error occurred: {str(e)}"
 
@@ -47,12 +48,14 @@ def parse_input(user_input):
         user_input (str): рядок введений користувачем.
 
     Повертає:
-        cmd (str): команда в нижньому регістрі.
+        cmd (str): команда в нижньому регістрі (порожній рядок для порожнього вводу).
         *args (list): список аргументів команди.
     """
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    parts = user_input.split(maxsplit=1)
+    if not parts:
+        return ("",)
+    cmd = parts[0].lower()
+    return cmd, *(parts[1].split() if len(parts) > 1 else ())
 
 @input_error
 def add_contact(args, contacts):
@@ -67,7 +70,7 @@ def add_contact(args, contacts):
         str: повідомлення про успіх або помилку.
     """
     if len(args) != 2:
-        raise ValueError("Name and phone required")
+        return "Give me name and phone please."
     name, phone = args
     contacts[name] = phone
     return "Contact added."
@@ -85,10 +88,10 @@ def change_contact(args, contacts):
         str: повідомлення про успіх або помилку.
     """
     if len(args) != 2:
-        raise ValueError("Name and phone required")
+        return "Give me name and phone please."
     name, phone = args
     if name not in contacts:
-        raise KeyError("Contact does not exist")
+        return "Contact not found, please enter a valid name."
     contacts[name] = phone
     return "Contact changed."
 
@@ -105,11 +108,11 @@ def find_phone(args, contacts):
         str: номер телефону або повідомлення про те, що контакт не знайдений.
     """
     if len(args) == 0:
-        raise IndexError("Name required")
-    name = args[0]
-    if name not in contacts:
-        raise KeyError("Contact does not exist")
-    return contacts[name]
+        return "Too few or too many arguments in your command."
+    phone = contacts.get(args[0], _MISSING)
+    if phone is _MISSING:
+        return "Contact not found, please enter a valid name."
+    return phone
 
 @input_error
 def show_all(contacts):
@@ -124,6 +127,18 @@ def show_all(contacts):
     """
     return contacts
 
+# Обробники команд: кожен приймає список аргументів і словник контактів
+# та повертає рядок для виводу.
+HANDLERS = {
+    "hello": lambda args, contacts: "How can I help you?",
+    "add": add_contact,
+    "change": change_contact,
+    "phone": find_phone,
+    "all": lambda args, contacts: show_all(contacts),
+}
+
+EXIT_COMMANDS = frozenset({"close", "exit"})
+
 def main():
     """
     Головна функція, яка запускає консольний асистент.
@@ -137,19 +152,12 @@ def main():
         user_input = input("Enter a command: ")
         command, *args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        handler = HANDLERS.get(command)
+        if handler:
+            print(handler(args, contacts))
+        elif command in EXIT_COMMANDS:
             print("Good bye!")
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, contacts))
-        elif command == "change":
-            print(change_contact(args, contacts))
-        elif command == "phone":
-            print(find_phone(args, contacts))
-        elif command == "all":
-            print(show_all(contacts))
         else:
             print("Invalid command.")
 